@@ -0,0 +1,109 @@
+# ---------------------------
+# Shared Knowledge Graph Data
+# ---------------------------
+# Imported by the Streamlit apps (kg_toggle.py, kg_hierarchial.py,
+# kg_concentric.py, Untitled-1.py). Python caches imported modules, so the
+# lists and the adjacency index below are built once per server process.
+
+# Categories
+SYSTEMS = ["Hydraulic System", "Electrical System", "Fuel System"]
+COMPONENTS = ["Actuator", "Hydraulic Pump", "Reservoir", "Battery", "Generator", "Wiring"]
+LOCATIONS = ["Landing Gear Bay", "Wing", "Fuselage", "Engine Bay"]
+STANDARDS = ["SAE-AS7949", "MIL-PRF-5606", "MIL-PRF-81757", "FAA Part 25"]
+SUPPLIERS = ["Safran", "Parker Aerospace", "Honeywell"]
+
+ALL_NODES = ["Aircraft"] + SYSTEMS + COMPONENTS + LOCATIONS + STANDARDS + SUPPLIERS
+NODES = frozenset(ALL_NODES)  # for membership checks
+
+RELATIONSHIPS = [
+    ("Aircraft", "Hydraulic System", "includes"),
+    ("Aircraft", "Electrical System", "includes"),
+    ("Aircraft", "Fuel System", "includes"),
+
+    ("Hydraulic System", "Actuator", "includes"),
+    ("Hydraulic System", "Hydraulic Pump", "includes"),
+    ("Hydraulic System", "Reservoir", "includes"),
+
+    ("Electrical System", "Battery", "includes"),
+    ("Electrical System", "Generator", "includes"),
+    ("Electrical System", "Wiring", "includes"),
+
+    ("Actuator", "Landing Gear Bay", "located in"),
+    ("Hydraulic Pump", "Engine Bay", "located in"),
+    ("Battery", "Fuselage", "located in"),
+    ("Generator", "Engine Bay", "located in"),
+    ("Wiring", "Wing", "routed through"),
+
+    ("Actuator", "SAE-AS7949", "conforms to"),
+    ("Hydraulic Pump", "MIL-PRF-5606", "uses fluid spec"),
+    ("Battery", "MIL-PRF-81757", "conforms to"),
+    ("Wiring", "FAA Part 25", "regulated under"),
+
+    ("Actuator", "Safran", "supplied by"),
+    ("Hydraulic Pump", "Parker Aerospace", "supplied by"),
+    ("Battery", "Honeywell", "supplied by"),
+    ("Generator", "Honeywell", "supplied by")
+]
+
+
+# Adjacency index: node -> [(neighbor, relation), ...], with an entry for every node
+def _build_adjacency() -> dict[str, list[tuple[str, str]]]:
+    adj = {node: [] for node in ALL_NODES}
+    for src, dst, rel in RELATIONSHIPS:
+        adj[src].append((dst, rel))
+    return adj
+
+
+ADJ = _build_adjacency()
+
+# Hierarchy levels for the PyVis views (Aircraft on top, then Systems, then Components, then others)
+LEVELS = {
+    "Aircraft": 0,
+    **dict.fromkeys(SYSTEMS, 1),
+    **dict.fromkeys(COMPONENTS, 2),
+    **dict.fromkeys(LOCATIONS, 3),
+    **dict.fromkeys(STANDARDS, 3),
+    **dict.fromkeys(SUPPLIERS, 4)
+}
+
+# Node colors by type
+COLOR_MAP = {
+    **dict.fromkeys(SYSTEMS, "#1f77b4"),     # blue for systems
+    **dict.fromkeys(COMPONENTS, "#2ca02c"),  # green for components
+    **dict.fromkeys(LOCATIONS, "#ff7f0e"),   # orange for locations
+    **dict.fromkeys(STANDARDS, "#9467bd"),   # purple for standards
+    **dict.fromkeys(SUPPLIERS, "#d62728"),   # red for suppliers
+    "Aircraft": "#000000"                    # black for core
+}
+
+
+# Fixed (x, y) per node for the PyVis views: one row per level, rows
+# LEVEL_SEPARATION apart and nodes NODE_SPACING apart, each row centred on x=0.
+# Rows are ordered by the mean x of each node's parents to limit edge crossings.
+LEVEL_SEPARATION = 180
+NODE_SPACING = 200
+
+
+def _layered_positions() -> dict[str, tuple[float, float]]:
+    parents = {node: [] for node in ALL_NODES}
+    for src, dst, _ in RELATIONSHIPS:
+        parents[dst].append(src)
+
+    rows = {}
+    for node in ALL_NODES:
+        rows.setdefault(LEVELS[node], []).append(node)
+
+    pos = {}
+    for level in sorted(rows):
+        def barycenter(node):
+            xs = [pos[p][0] for p in parents[node] if p in pos]
+            return sum(xs) / len(xs) if xs else 0.0
+
+        row = sorted(rows[level], key=barycenter)
+        offset = (len(row) - 1) * NODE_SPACING / 2
+        for i, node in enumerate(row):
+            pos[node] = (i * NODE_SPACING - offset, level * LEVEL_SEPARATION)
+    return pos
+
+
+POSITIONS = _layered_positions()
@@ -0,0 +1,248 @@
+# ---------------------------
+# Shared Streamlit UI Pieces
+# ---------------------------
+# Used by the Streamlit apps (kg_toggle.py, kg_hierarchial.py, kg_concentric.py,
+# Untitled-1.py) so the PyVis view, the concentric Plotly view and the search panel are
+# defined once.
+import math
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+from pyvis.network import Network
+from kg_data import SYSTEMS, COMPONENTS, LOCATIONS, STANDARDS, SUPPLIERS, ALL_NODES, RELATIONSHIPS, NODES, ADJ, COLOR_MAP, POSITIONS
+
+# Serialize Plotly figures with orjson (much faster on NumPy arrays); set once for every app
+pio.json.config.default_engine = "orjson"
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy layout below is used instead
+    njit = None
+
+
+def new_network() -> Network:
+    # pyvis' default "local" mode already links vis-network from cdnjs rather than inlining it.
+    # Its lib/bindings/utils.js reference 404s inside Streamlit's iframe, but that script only
+    # backs the select/filter/highlight menus, which these views do not use.
+    return Network(height="600px", width="100%", directed=True)
+
+
+# The data is static, so the rendered PyVis HTML is built once and reused on
+# every rerun (e.g. each keystroke in the search box).
+@st.cache_data
+def build_pyvis_html() -> str:
+    net = new_network()
+
+    # Add styled nodes at their precomputed layered positions
+    for node in ALL_NODES:
+        x, y = POSITIONS[node]
+        net.add_node(node, x=x, y=y, fixed={"x": True, "y": True}, physics=False,
+                     color=COLOR_MAP.get(node, "#cccccc"), size=25 if node == "Aircraft" else 15)
+
+    # Add edges with their relation as hover/label text
+    for src, dst, rel in RELATIONSHIPS:
+        net.add_edge(src, dst, title=rel, label=rel)
+
+    # Positions are precomputed server-side, so vis.js runs no layout or physics
+    net.set_options("""
+    {
+      "layout": {
+        "hierarchical": {
+          "enabled": false
+        }
+      },
+      "nodes": {
+        "borderWidth": 1,
+        "shadow": true,
+        "shapeProperties": {"interpolation": false}
+      },
+      "edges": {
+        "smooth": false,
+        "arrows": {"to": {"enabled": true}}
+      },
+      "interaction": {
+        "hideEdgesOnDrag": true
+      },
+      "physics": {
+        "enabled": false
+      }
+    }
+    """)
+
+    # Render in memory rather than writing aircraft_graph.html and reading it
+    # back, which also avoids concurrent sessions racing on the same file.
+    return net.generate_html(notebook=False)
+
+
+# ---------------------------
+# Layout: concentric layers
+# ---------------------------
+# Node i of group g sits at angle 2*pi*i/n on the ring of radius radii[g].
+# Groups occupy consecutive slices [group_starts[g], group_starts[g] + n) of the output.
+def _concentric_layout_numpy(radii, group_starts, group_sizes, N):
+    xs = np.empty(N)
+    ys = np.empty(N)
+    for r, base, n in zip(radii, group_starts, group_sizes):
+        theta = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        xs[base:base + n] = r * np.cos(theta)
+        ys[base:base + n] = r * np.sin(theta)
+    return xs, ys
+
+
+# Scalar loop for numba to compile; scales to large node counts without temporaries
+def _concentric_layout_loop(radii, group_starts, group_sizes, N):
+    xs = np.empty(N)
+    ys = np.empty(N)
+    for g in range(len(group_sizes)):
+        r = radii[g]
+        n = group_sizes[g]
+        base = group_starts[g]
+        for i in range(n):
+            a = 2 * math.pi * i / n
+            xs[base + i] = r * math.cos(a)
+            ys[base + i] = r * math.sin(a)
+    return xs, ys
+
+
+if njit is not None:
+    _concentric_layout = njit(cache=True)(_concentric_layout_loop)
+else:
+    _concentric_layout = _concentric_layout_numpy
+
+
+# Outlines of the filled concentric layers (101 points, closed), computed once
+_THETA = np.linspace(0, 2 * np.pi, 101)
+_CIRCLES = [(r * np.cos(_THETA), r * np.sin(_THETA)) for r in (200, 400, 600)]
+
+
+# The data is static, so the Plotly figure is built once per background style and
+# reused on every rerun.
+@st.cache_resource
+def build_plotly_fig(filled_layers: bool = False) -> go.Figure:
+    layers = {
+        "Aircraft": 0,
+        "Systems": 1,
+        "Components": 2,
+        "Suppliers": 3,
+        "Standards": 3,
+        "Locations": 3,
+    }
+    colors = {
+        "Aircraft": "black",
+        "Systems": "blue",
+        "Components": "green",
+        "Suppliers": "orange",
+        "Standards": "purple",
+        "Locations": "brown",
+    }
+    radii = {0: 0, 1: 200, 2: 400, 3: 600}
+
+    groups = [
+        ("Aircraft", ["Aircraft"]),
+        ("Systems", SYSTEMS),
+        ("Components", COMPONENTS),
+        ("Suppliers", SUPPLIERS),
+        ("Standards", STANDARDS),
+        ("Locations", LOCATIONS),
+    ]
+
+    # Node positions as parallel x/y arrays
+    ordered = [node for _, nodeset in groups for node in nodeset]
+    node2idx = {node: i for i, node in enumerate(ordered)}
+    group_sizes = np.array([len(nodeset) for _, nodeset in groups], dtype=np.int64)
+    group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1])).astype(np.int64)
+    group_radii = np.array([radii[layers[category]] for category, _ in groups], dtype=np.float64)
+    xs, ys = _concentric_layout(group_radii, group_starts, group_sizes, len(ordered))
+
+    # Build Plotly visualization
+    # Segments are interleaved as [x0, x1, NaN]; Plotly breaks the line at NaN
+    n_edges = len(RELATIONSHIPS)
+    src_idx = np.fromiter((node2idx[src] for src, _, _ in RELATIONSHIPS), dtype=np.int32, count=n_edges)
+    dst_idx = np.fromiter((node2idx[dst] for _, dst, _ in RELATIONSHIPS), dtype=np.int32, count=n_edges)
+    gap = np.full(n_edges, np.nan)
+    edge_x = np.stack([xs[src_idx], xs[dst_idx], gap], axis=1).ravel()
+    edge_y = np.stack([ys[src_idx], ys[dst_idx], gap], axis=1).ravel()
+
+    edge_trace = go.Scattergl(
+        x=edge_x, y=edge_y,
+        line=dict(width=1, color="gray"),
+        hoverinfo="none",
+        mode="lines"
+    )
+
+    # All nodes in one trace, colored per point; category goes in customdata
+    all_cats = np.array([cat for cat, nodeset in groups for _ in nodeset])
+    all_colors = np.array([colors[cat] for cat in all_cats])
+    node_trace = go.Scattergl(
+        x=xs, y=ys,
+        mode="markers+text",
+        text=ordered,
+        customdata=all_cats,
+        hovertemplate="%{text} (%{customdata})<extra></extra>",
+        textposition="top center",
+        marker=dict(size=20, color=all_colors),
+        showlegend=False
+    )
+
+    # Legend-only entries, one per category (no points drawn)
+    legend_traces = [
+        go.Scattergl(
+            x=[None], y=[None],
+            mode="markers",
+            marker=dict(size=20, color=colors[cat]),
+            name=cat
+        )
+        for cat, _ in groups
+    ]
+
+    # Background: filled concentric layers (SVG Scatter: Scattergl does not support
+    # fill="toself"), or dotted rings drawn as layout shapes
+    fill_traces = []
+    circle_shapes = []
+    if filled_layers:
+        fill_colors = ["rgba(173,216,230,0.2)", "rgba(144,238,144,0.2)", "rgba(255,182,193,0.2)"]  # light blue, light green, light pink
+        for i, (x, y) in enumerate(_CIRCLES):
+            fill_traces.append(
+                go.Scatter(
+                    x=x, y=y,
+                    fill="toself",
+                    fillcolor=fill_colors[i % len(fill_colors)],
+                    line=dict(color="rgba(0,0,0,0)"),
+                    hoverinfo="none",
+                    mode="lines",
+                    showlegend=False
+                )
+            )
+    else:
+        for r in [200, 400, 600]:
+            circle_shapes.append(
+                dict(
+                    type="circle",
+                    xref="x", yref="y",
+                    x0=-r, y0=-r, x1=r, y1=r,
+                    line=dict(color="lightgray", width=1, dash="dot"),
+                )
+            )
+
+    fig = go.Figure(data=fill_traces + [edge_trace, node_trace] + legend_traces)
+    fig.update_layout(
+        showlegend=True,
+        height=700,
+        shapes=circle_shapes,
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    )
+    return fig
+
+
+# Search functionality
+# Runs as a fragment so typing in the search box only reruns this panel,
+# not the graph rendering around it.
+@st.fragment
+def search_panel(nodes=NODES, adj=ADJ):
+    search_part = st.text_input("Search for a part, location, standard, or supplier:")
+    if search_part and search_part in nodes:
+        st.subheader(f"Connections for {search_part}:")
+        for v, rel in adj[search_part]:
+            st.write(f"- {search_part} → {rel} → {v}")
@@ -38,23 +38,12 @@
 "# ---2.Build NetworkX Graph ---\n",
 "G=nx.DiGraph()\n",
 "\n",
-"for index,row in nodes_doc.iterrows():\n",
-    "node_id=row['id']\n",
-    "node_type=row['type']\n",
-    "properties=row.drop(['id','type']).dropna.to_dict()", #Get all other columns as properties\n",
-    "G.add_node(node_id,type=node_type, **properties)\n",
-    "\n",
-"for index,row in nodes_draw.iterrows():\n",
-    "node_id=row['id']\n",
-    "node_type=row['type']\n",
-    "properties=row.drop(['id','type']).dropna.to_dict()", #Get all other columns as properties\n",
-    "G.add_node(node_id,type=node_type, **properties)\n",
-    "\n",
-"for index,row in relationships_df.iterrows():\n",
-    "source=row['source_id']\n",
-    "target=row['target_id']\n",
-    "rel_type=row['relationship_type']\n",
-    "G.add_edge('source,target,type=rel_type')\n",
+"# Bulk-insert nodes from records (one pass, no per-row Series); NaN properties are dropped\n",
+"for df in (nodes_doc, nodes_draw):\n",
+"    records=df.to_dict(orient='records')\n",
+"    G.add_nodes_from([(r.pop('id'), {k:v for k,v in r.items() if pd.notna(v)}) for r in records])\n",
+"\n",
+"G.add_edges_from(zip(relationships_df.source_id, relationships_df.target_id, [{'type':t} for t in relationships_df.relationship_type]))\n",
 "\n",
 "print(f\"Graph built with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.\")\n",
 "\n",
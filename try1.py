@@ -3,7 +3,7 @@
 build_knowledge_graph.py
 
 Single-file script you can open & run in VS Code to build a Knowledge Graph from
-three CSVs and export an interactive HTML visualization (pyvis).
+three CSVs and export an interactive HTML visualization (vis-network, as used by pyvis).
 
 Usage examples:
   python build_knowledge_graph.py                                    # uses defaults or creates sample data if missing
@@ -12,7 +12,10 @@ Usage examples:
        --output technical_kg_poc.html
 
 Dependencies:
-  pip install pandas networkx pyvis
+  pip install pandas networkx
+  pip install orjson           # optional: faster JSON parsing of cells and serialization of the HTML export
+  pip install pyarrow          # optional: faster multithreaded CSV parsing
+  pip install rustworkx        # optional: --backend rustworkx
 
 This script is intentionally defensive: it will try several common column names,
 create sample CSVs if the input files are missing, and give helpful error messages.
@@ -20,28 +23,291 @@ create sample CSVs if the input files are missing, and give helpful error messag
 """
 
 import argparse
+import csv
 import json
 import logging
 import os
+import queue
+import re
 import sys
+import threading
 import webbrowser
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
 
+import numpy as np
 import pandas as pd
 import networkx as nx
-from pyvis.network import Network
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' C parser
+    pa = None
+
+# JSON (de)serialization: orjson when it is installed, else the stdlib json module
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+try:
+    import rustworkx as rx
+except ImportError:  # rustworkx is optional; only needed for --backend rustworkx
+    rx = None
 
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+# Cells that look like a JSON object or array (surrounding whitespace allowed)
+_JSON_RE = re.compile(r'^\s*(?:\{.*\}|\[.*\])\s*$', re.S)
+
+
+# Standalone pages written by export_pyvis, one per renderer. Each loads its library from a
+# CDN and gets the graph inlined as one JSON object at /*GRAPH_JSON*/:
+#   {"nodes": [{id, label, title, group}], "edges": [{from, to, title, label}]}
+#
+# pyvis: vis-network (the library pyvis wraps), drawn on a 2D canvas. The options match what
+# pyvis produced for Network(directed=True, bgcolor="#222222", font_color="white").repulsion().
+_VIS_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css" integrity="sha512-WgxfT5LWjfszlPHXRmBWHkV2eceiWTOBvrKCNbdgDYTHrT2AeLCGbF4sZlZw3UMN3WtL0tGUoIAKsu8mllg/XA==" crossorigin="anonymous" referrerpolicy="no-referrer" />
+<script src="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js" integrity="sha512-LnvoEWDFrqGHlHmDD2101OrLcbsfkrzoSpvtSQtxK3RMnRV0eOkhhBN2dXHKRrUU8p2DGRTk35n4O8nWSVe1mQ==" crossorigin="anonymous" referrerpolicy="no-referrer"></script>
+<style type="text/css">
+  #mynetwork {
+    width: 100%;
+    height: 750px;
+    background-color: #222222;
+    border: 1px solid lightgray;
+    position: relative;
+    float: left;
+  }
+</style>
+</head>
+<body>
+<div id="mynetwork"></div>
+<script type="text/javascript">
+  const graph = /*GRAPH_JSON*/;
+  const options = {
+    nodes: {shape: "dot", font: {color: "white"}},
+    edges: {arrows: "to", color: {inherit: true}, smooth: {enabled: true, type: "dynamic"}},
+    interaction: {dragNodes: true, hideEdgesOnDrag: false, hideNodesOnDrag: false},
+    physics: {
+      enabled: true,
+      solver: "repulsion",
+      repulsion: {centralGravity: 0.2, damping: 0.09, nodeDistance: 200, springConstant: 0.05, springLength: 200},
+      stabilization: {enabled: true, fit: true, iterations: 1000, onlyDynamicEdges: false, updateInterval: 50}
+    }
+  };
+  new vis.Network(
+    document.getElementById("mynetwork"),
+    {nodes: new vis.DataSet(graph.nodes), edges: new vis.DataSet(graph.edges)},
+    options
+  );
+</script>
+</body>
+</html>
+"""
+
+# Colours for the node groups in the WebGL pages (vis-network colours groups itself)
+_GROUP_COLORS_JS = ("const palette = ['#97c2fc', '#ffff00', '#fb7e81', '#7be141', '#eb7df4', "
+                    "'#ad85e4', '#ffa807', '#6e6efd', '#ffc0cb', '#c2fabc'];\n"
+                    "  const groupColor = {};\n"
+                    "  const colorOf = (g) => groupColor[g] ||= palette[Object.keys(groupColor).length % palette.length];")
+
+# Hover tooltip shared by the WebGL pages; titles are shown as text, one line per <br>
+_TOOLTIP_JS = """const tooltip = document.getElementById("tooltip");
+  const showTitle = (title) => {
+    tooltip.textContent = (title || "").split("<br>").join("\\n");
+    tooltip.style.display = title ? "block" : "none";
+  };"""
+
+_WEBGL_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+/*SCRIPTS*/
+<style type="text/css">
+  #mynetwork {
+    width: 100%;
+    height: 750px;
+    background-color: #222222;
+    border: 1px solid lightgray;
+    position: relative;
+  }
+  #tooltip {
+    display: none;
+    position: absolute;
+    top: 8px;
+    left: 8px;
+    z-index: 10;
+    padding: 6px 8px;
+    white-space: pre-line;
+    font: 12px sans-serif;
+    color: #222222;
+    background: #ffffe0;
+    border: 1px solid #999999;
+  }
+</style>
+</head>
+<body>
+<div id="mynetwork"><div id="tooltip"></div></div>
+"""
+
+# sigma: Sigma.js (WebGL) on a graphology graph, laid out client-side with ForceAtlas2
+_SIGMA_TEMPLATE = _WEBGL_HEAD.replace("/*SCRIPTS*/", """\
+<script src="https://cdn.jsdelivr.net/npm/graphology@0.25.4/dist/graphology.umd.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/graphology-library@0.8.0/dist/graphology-library.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/sigma@2.4.0/build/sigma.min.js"></script>""") + """\
+<script type="text/javascript">
+  const graph = /*GRAPH_JSON*/;
+  """ + _GROUP_COLORS_JS + """
+  """ + _TOOLTIP_JS + """
+  const g = new graphology.DirectedGraph();
+  for (const n of graph.nodes) {
+    g.addNode(n.id, {label: String(n.label), title: n.title, color: colorOf(n.group), size: 5});
+  }
+  for (const e of graph.edges) {
+    g.addEdge(e.from, e.to, {label: e.label == null ? "" : String(e.label), type: "arrow", size: 1});
+  }
+  const fa2 = graphologyLibrary.layoutForceAtlas2;
+  graphologyLibrary.layout.random.assign(g);
+  fa2.assign(g, {iterations: 100, settings: fa2.inferSettings(g)});
+  const renderer = new Sigma(g, document.getElementById("mynetwork"), {
+    defaultEdgeType: "arrow",
+    labelColor: {color: "#ffffff"}
+  });
+  renderer.on("enterNode", ({node}) => showTitle(g.getNodeAttribute(node, "title")));
+  renderer.on("leaveNode", () => showTitle(null));
+</script>
+</body>
+</html>
+"""
+
+# cytoscape-webgl: Cytoscape.js (3.31+) with its WebGL renderer and the built-in cose layout
+_CYTOSCAPE_TEMPLATE = _WEBGL_HEAD.replace("/*SCRIPTS*/", """\
+<script src="https://cdn.jsdelivr.net/npm/cytoscape@3.31.0/dist/cytoscape.min.js"></script>""") + """\
+<script type="text/javascript">
+  const graph = /*GRAPH_JSON*/;
+  """ + _GROUP_COLORS_JS + """
+  """ + _TOOLTIP_JS + """
+  const elements = graph.nodes.map((n) => ({
+    data: {id: n.id, label: String(n.label), title: n.title, color: colorOf(n.group)}
+  }));
+  // edges get no id: Cytoscape generates ids that cannot collide with node ids
+  graph.edges.forEach((e) => elements.push({
+    data: {source: e.from, target: e.to, label: e.label == null ? "" : String(e.label)}
+  }));
+  const cy = cytoscape({
+    container: document.getElementById("mynetwork"),
+    elements: elements,
+    renderer: {name: "canvas", webgl: true},
+    layout: {name: "cose", animate: false},
+    style: [
+      {selector: "node", style: {"background-color": "data(color)", "label": "data(label)", "color": "#ffffff", "font-size": 10}},
+      {selector: "edge", style: {"width": 1, "line-color": "#848484", "target-arrow-color": "#848484",
+                                 "target-arrow-shape": "triangle", "curve-style": "straight"}}
+    ]
+  });
+  cy.on("mouseover", "node", (evt) => showTitle(evt.target.data("title")));
+  cy.on("mouseout", "node", () => showTitle(null));
+</script>
+</body>
+</html>
+"""
+
+RENDERERS = {"pyvis": _VIS_TEMPLATE, "sigma": _SIGMA_TEMPLATE, "cytoscape-webgl": _CYTOSCAPE_TEMPLATE}
+
+# Canvas rendering slows down sharply on large graphs; above this many nodes export_pyvis
+# switches to the WebGL sigma page unless a renderer is given explicitly
+WEBGL_NODE_THRESHOLD = 2000
+
+
+# A table is either a whole DataFrame or an iterable of DataFrame chunks (pd.read_csv(chunksize=...))
+Frames = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+# Cells that pd.read_csv reads as NA by default (its documented na_values list);
+# pyarrow's own default set lacks e.g. "None" and "<NA>"
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
 
-def read_csv_if_exists(path: str) -> Optional[pd.DataFrame]:
+def _read_csv_arrow(path: str, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
+    """Parse path with pyarrow's multithreaded CSV reader, matching pd.read_csv(dtype=str):
+    every column is declared as a string up front (pandas' engine="pyarrow" infers types
+    first, so '001' would become '1'), a UTF-8 BOM is dropped from the header and pandas'
+    NA tokens are read as missing. Returns None when the read is left to pandas: for a
+    header with duplicate names, which pandas renames (name, name.1), and when none of
+    columns is in the file."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    if len(set(header)) != len(header):
+        return None
+    if columns is not None:
+        header = [c for c in header if c in columns]
+        if not header:
+            return None  # pyarrow reads an empty include_columns as "all columns"
+    convert_options = pa_csv.ConvertOptions(
+        column_types={c: pa.string() for c in header},
+        include_columns=header if columns is not None else None,
+        null_values=_PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    # quoted cells may span lines (pandas' C parser accepts them; pyarrow only when asked to)
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    return pa_csv.read_csv(path, parse_options=parse_options, convert_options=convert_options).to_pandas()
+
+
+def _logged_chunks(reader: Iterable[pd.DataFrame], path: str) -> Iterator[pd.DataFrame]:
+    """Yield the chunks of a lazy pd.read_csv reader. Parse errors only surface while
+    iterating, so they are logged here like read_csv_if_exists does for whole files; the
+    chunks before the bad one have already been used, and the rest of the file is skipped."""
+    try:
+        yield from reader
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        logging.error("Failed to read %s: %s", path, e)
+
+
+def read_csv_if_exists(path: str, chunksize: Optional[int] = None, columns: Optional[list] = None) -> Optional[Frames]:
+    """Read path as strings. With chunksize, return an iterator of DataFrame chunks instead of
+    one DataFrame, so peak memory is bounded by the chunk size rather than the file size
+    (a parse error part way through is logged and ends the iterator early; see _logged_chunks).
+    With columns, only those columns are parsed (names missing from the file are ignored)."""
     if not os.path.exists(path):
         logging.debug("File not found: %s", path)
         return None
+    if columns is not None:
+        columns = set(columns)
+    usecols = columns.__contains__ if columns is not None else None
     try:
-        df = pd.read_csv(path, dtype=str)
+        if chunksize:
+            reader = pd.read_csv(path, dtype=str, chunksize=chunksize, usecols=usecols)
+            logging.info("Streaming %s in chunks of %d rows", path, chunksize)
+            return _logged_chunks(reader, path)
+        # pyarrow cannot stream chunks, so it is only used for whole-file reads
+        df = None
+        if pa is not None:
+            try:
+                df = _read_csv_arrow(path, columns)
+            except pa.ArrowInvalid as e:
+                logging.warning("pyarrow could not parse %s (%s); retrying with pandas", path, e)
+        if df is None:
+            df = pd.read_csv(path, dtype=str, usecols=usecols)
         logging.info("Loaded %s (rows=%d, cols=%d)", path, len(df), len(df.columns))
         return df
     except Exception as e:
@@ -49,20 +315,134 @@ def read_csv_if_exists(path: str) -> Optional[pd.DataFrame]:
         return None
 
 
-def parse_properties_from_row(row: pd.Series, drop_cols: list) -> dict:
-    """Return a dict of non-empty properties for a row, parsing JSON strings when appropriate."""
-    props = row.drop(labels=drop_cols, errors='ignore').replace('', pd.NA).dropna().to_dict()
-    for k, v in list(props.items()):
-        if isinstance(v, str):
-            s = v.strip()
-            # try to parse JSON-ish values (dicts, lists)
-            if (s.startswith('{') and s.endswith('}')) or (s.startswith('[') and s.endswith(']')):
+def parse_property_columns(df: pd.DataFrame, drop_idx: set) -> list:
+    """Return one dict of non-empty properties per row of df (in row order), skipping the
+    column positions in drop_idx.
+
+    Works column by column: empty cells are masked out once per column, and JSON parsing
+    is only attempted on the remaining cells that match the precompiled _JSON_RE."""
+    match_json = _JSON_RE.match
+    rows = [{} for _ in range(len(df))]
+    keep = [(i, c) for i, c in enumerate(df.columns) if i not in drop_idx]
+    for i, c in keep:
+        values = df.iloc[:, i].to_numpy(dtype=object)
+        present = pd.notna(values) & (values != '')
+        for j in present.nonzero()[0]:
+            v = values[j]
+            if isinstance(v, str) and match_json(v):
                 try:
-                    props[k] = json.loads(s)
+                    v = json_loads(v)
                 except Exception:
                     # leave as string if JSON parsing fails
                     pass
-    return props
+            rows[j][c] = v
+    return rows
+
+
+def title_text(value) -> str:
+    """Tooltip text of an attribute value: dicts and lists as JSON, anything else via str()."""
+    return json_dumps(value) if isinstance(value, (dict, list)) else str(value)
+
+
+def edge_titles(df: pd.DataFrame, rel_idx: Optional[int], drop_idx: set) -> list:
+    """Return the export tooltip of each relation row, "relationship: <type>; <col>: <value>; ...",
+    built one column at a time over the whole frame. Empty cells and the columns in
+    drop_idx are skipped, as in parse_property_columns. Cells that parse as JSON there are
+    shown via title_text() of the parsed value, so they read the same as tooltips that
+    export_pyvis builds from the edge attributes."""
+    rel_text = str_column(df, rel_idx) if rel_idx is not None else ["RELATED_TO"] * len(df)
+    titles = "relationship: " + pd.Series(rel_text, dtype=object)
+    for i, c in enumerate(df.columns):
+        if i in drop_idx:
+            continue
+        values = df.iloc[:, i].to_numpy(dtype=object)
+        present = pd.notna(values) & (values != '')
+        cells = pd.Series(values, dtype=object).where(present, '')
+        json_like = present & cells.str.lstrip().str[:1].isin(['{', '[']).to_numpy()
+        for j in json_like.nonzero()[0]:
+            if _JSON_RE.match(cells.iat[j]):
+                try:
+                    cells.iat[j] = title_text(json_loads(cells.iat[j]))
+                except Exception:
+                    # shown as is, like the string parse_property_columns keeps
+                    pass
+        titles = titles + (f"; {c}: " + cells).where(present, '')
+    return titles.tolist()
+
+
+def iter_frames(data: Optional[Frames], prefetch: int = 2) -> Iterator[pd.DataFrame]:
+    """Yield the DataFrame(s) in data: a single DataFrame, an iterable of chunks, or nothing for None.
+
+    Chunks are read on a background thread, up to prefetch chunks ahead of the caller, so CSV
+    parsing (which largely releases the GIL) overlaps with inserting the previous chunk."""
+    if data is None:
+        return
+    if isinstance(data, pd.DataFrame):
+        yield data
+        return
+
+    chunks = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for chunk in data:
+                if stop.is_set():
+                    return
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)  # sentinel: no more chunks (also sent when reading fails)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        reading = pool.submit(produce)
+        chunk = chunks.get()
+        try:
+            while chunk is not None:
+                yield chunk
+                chunk = chunks.get()
+        finally:
+            # if the caller stopped early, let the producer finish: it checks stop before
+            # each put, and draining frees the slot it may be blocked on
+            stop.set()
+            while chunk is not None:
+                chunk = chunks.get()
+        reading.result()  # re-raise a read error from the producer thread
+
+
+# Accepted spellings for the columns build_graph needs, in order of preference
+ID_COLUMNS = ["id", "node_id", "Id", "ID"]
+TYPE_COLUMNS = ["type", "node_type", "Type"]
+SOURCE_COLUMNS = ["source_id", "source", "from", "From"]
+TARGET_COLUMNS = ["target_id", "target", "to", "To"]
+REL_TYPE_COLUMNS = ["relationship_type", "rel_type", "type", "relationship"]
+
+# Columns build_graph needs in every node / relations file; with --node-props or
+# --relation-props only these plus the listed property columns are read
+NODE_KEY_COLUMNS = ID_COLUMNS + TYPE_COLUMNS
+RELATION_KEY_COLUMNS = SOURCE_COLUMNS + TARGET_COLUMNS + REL_TYPE_COLUMNS
+
+
+def resolve_col(df: pd.DataFrame, candidates: list) -> Optional[int]:
+    """Return the position of the first candidate column found in df.columns, else None."""
+    for c in candidates:
+        if c in df.columns:
+            return df.columns.get_loc(c)
+    return None
+
+
+def str_column(df: pd.DataFrame, idx: int) -> list:
+    """Return the column at position idx as a list of str, converted once per chunk rather
+    than per row (same values as calling str() on each cell, e.g. 'nan' for missing cells).
+    Not numpy's astype(str): its fixed-width array would size every cell to the longest one."""
+    return list(map(str, df.iloc[:, idx].to_numpy(dtype=object)))
+
+
+def intern_column(df: pd.DataFrame, idx: int) -> list:
+    """Return the column at position idx as a list with its str values interned, so a small
+    vocabulary (node types, relationship types) is stored as one object per distinct value.
+    Other values (e.g. NaN for missing cells) are kept as is."""
+    values = df.iloc[:, idx].to_numpy(dtype=object)
+    return [sys.intern(v) if isinstance(v, str) else v for v in values]
 
 
 def ensure_name(df: pd.DataFrame, candidates: list) -> str:
@@ -73,6 +453,91 @@ def ensure_name(df: pd.DataFrame, candidates: list) -> str:
     raise KeyError(f"None of the expected columns found in dataframe: {candidates}")
 
 
+class RxDiGraph:
+    """rustworkx.PyDiGraph behind the small part of the nx.DiGraph API that build_graph and
+    export_pyvis use. Nodes and edges are stored by rustworkx (multigraph=False, so one edge
+    per ordered pair); only the string id <-> integer index mapping is kept in Python, and
+    attribute dicts are the node/edge payloads."""
+
+    def __init__(self):
+        if rx is None:
+            raise ImportError("rustworkx is not installed (pip install rustworkx)")
+        self._g = rx.PyDiGraph(multigraph=False)
+        self._idx = {}  # node id -> node index
+        self._ids = []  # node index -> node id
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._idx
+
+    @property
+    def nodes(self) -> "_RxNodeView":
+        return _RxNodeView(self)
+
+    def add_node(self, node_id, **attrs):
+        self.add_nodes_from([(node_id, attrs)])
+
+    def add_nodes_from(self, items: Iterable[tuple]):
+        """Add (node_id, attrs) pairs; attrs of nodes already present are merged, as in NetworkX."""
+        pending = {}
+        for node_id, attrs in items:
+            if node_id in self._idx:
+                self._g[self._idx[node_id]].update(attrs)
+            elif node_id in pending:
+                pending[node_id].update(attrs)
+            else:
+                pending[node_id] = dict(attrs)
+        for node_id, i in zip(pending, self._g.add_nodes_from(list(pending.values()))):
+            self._idx[node_id] = i
+        self._ids.extend(pending)
+
+    def add_edges_from(self, edges: Iterable[tuple]):
+        """Add (source, target, attrs) triples between existing nodes; repeated pairs merge attrs."""
+        pending = {}  # (source index, target index) -> attrs, for edges new in this batch
+        for src, tgt, attrs in edges:
+            pair = (self._idx[src], self._idx[tgt])
+            if pair in pending:
+                pending[pair].update(attrs)
+            elif self._g.has_edge(*pair):
+                # payloads are the stored dicts themselves, so this updates the edge in place
+                self._g.get_edge_data(*pair).update(attrs)
+            else:
+                pending[pair] = dict(attrs)
+        self._g.add_edges_from([(u, v, attrs) for (u, v), attrs in pending.items()])
+
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        ids = self._ids
+        for u, v, attrs in self._g.weighted_edge_list():
+            yield (ids[u], ids[v], attrs) if data else (ids[u], ids[v])
+
+    def number_of_nodes(self) -> int:
+        return self._g.num_nodes()
+
+    def number_of_edges(self) -> int:
+        return self._g.num_edges()
+
+
+class _RxNodeView:
+    """G.nodes[node_id] -> attrs, iter(G.nodes) -> node ids and G.nodes(data=True) -> (node_id, attrs) pairs."""
+
+    def __init__(self, graph: RxDiGraph):
+        self._graph = graph
+
+    def __getitem__(self, node_id) -> dict:
+        return self._graph._g[self._graph._idx[node_id]]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._graph._ids)
+
+    def __call__(self, data: bool = False) -> Iterator:
+        ids = self._graph._ids
+        return zip(ids, self._graph._g.nodes()) if data else iter(ids)
+
+
+# Graph backends accepted by build_graph; both expose the API used by build_graph and export_pyvis
+BACKENDS = {"networkx": nx.DiGraph, "rustworkx": RxDiGraph}
+Graph = Union[nx.DiGraph, RxDiGraph]
+
+
 def create_sample_files(out_dir: str = "sample_data") -> tuple:
     os.makedirs(out_dir, exist_ok=True)
     nodes_doc_path = os.path.join(out_dir, "NodeDocuments.csv")
@@ -102,137 +567,160 @@ def create_sample_files(out_dir: str = "sample_data") -> tuple:
     return nodes_doc_path, nodes_draw_path, relations_path
 
 
-def build_graph(nodes_doc_df: Optional[pd.DataFrame], nodes_draw_df: Optional[pd.DataFrame], relations_df: Optional[pd.DataFrame]) -> nx.DiGraph:
-    G = nx.DiGraph()
+def build_graph(nodes_doc_df: Optional[Frames], nodes_draw_df: Optional[Frames], relations_df: Optional[Frames],
+                backend: str = "networkx", edge_titles_out: Optional[dict] = None) -> Graph:
+    """Build the graph from node and relation tables. Each table may be a DataFrame or an
+    iterable of chunks; chunks are inserted into G incrementally as they arrive.
+
+    backend selects the graph class from BACKENDS (NetworkX by default). If edge_titles_out
+    is given, it is filled with the export tooltip of each edge, keyed by (source, target),
+    for export_pyvis; a pair that occurs more than once maps to None, since its attributes
+    are merged and the tooltip has to be built from the merged dict."""
+    G = BACKENDS[backend]()
 
     # Helper to add/merge node rows
     def add_nodes_from_df(df: pd.DataFrame, source_label: str):
         if df is None:
             return
-        # expected id col and type col might be named differently; accept common alternatives
-        id_col = None
-        for c in ["id", "node_id", "Id", "ID"]:
-            if c in df.columns:
-                id_col = c
-                break
-        if id_col is None:
+        # expected id col and type col might be named differently; accept common alternatives.
+        # Columns are resolved to positions once and read as whole arrays.
+        id_idx = resolve_col(df, ID_COLUMNS)
+        if id_idx is None:
             raise KeyError(f"No id column found in {source_label}; expected one of id/node_id/Id/ID")
+        type_idx = resolve_col(df, TYPE_COLUMNS)
+        props_by_row = parse_property_columns(df, drop_idx={id_idx, type_idx})
+
+        ids = str_column(df, id_idx)
+        node_types = intern_column(df, type_idx) if type_idx is not None else repeat(None)
+
+        # Rows whose id is already in G, or repeats an earlier row, take the merge path below;
+        # all other rows (every row on a fresh build) go into a single add_nodes_from call.
+        # Membership is checked against G's own index, not a set rebuilt from G for each chunk.
+        merge_mask = pd.Series(ids, dtype=object).duplicated().to_numpy()
+        if G.number_of_nodes():
+            merge_mask = merge_mask | np.fromiter((n in G for n in ids), bool, len(ids))
+
+        new_nodes, merges = [], []
+        for node_id, node_type, props, merge in zip(ids, node_types, props_by_row, merge_mask):
+            if merge:
+                merges.append((node_id, node_type, props))
+                continue
+            attrs = {"node_type": node_type} if node_type else {}
+            attrs.update(props)
+            new_nodes.append((node_id, attrs))
+        G.add_nodes_from(new_nodes)
+
+        for node_id, node_type, props in merges:
+            # merge into the existing node (prefer earlier values, but update with any new props)
+            existing = G.nodes[node_id]
+            # update node_type if new
+            if node_type:
+                existing.setdefault("node_type", node_type)
+            existing.update(props)
+
+    # Helper to add edge rows (and placeholder nodes for unknown endpoints)
+    def add_edges_from_df(df: pd.DataFrame):
+        # find source, target & relationship type columns
+        s_idx = resolve_col(df, SOURCE_COLUMNS)
+        t_idx = resolve_col(df, TARGET_COLUMNS)
+        if s_idx is None or t_idx is None:
+            raise KeyError("Relations CSV must contain source and target columns (e.g. source_id, target_id)")
+        rel_idx = resolve_col(df, REL_TYPE_COLUMNS)
+        props_by_row = parse_property_columns(df, drop_idx={s_idx, t_idx, rel_idx})
 
-        type_col = None
-        for c in ["type", "node_type", "Type"]:
-            if c in df.columns:
-                type_col = c
-                break
-
-        for _, row in df.iterrows():
-            node_id = str(row[id_col])
-            node_type = row[type_col] if type_col and type_col in row.index else None
-            props = parse_properties_from_row(row, drop_cols=[id_col, type_col])
-            # merge if node already exists (prefer earlier values, but update with any new props)
-            if node_id in G:
-                # update node_type if new
-                if node_type:
-                    G.nodes[node_id].setdefault("node_type", node_type)
-                G.nodes[node_id].update(props)
-            else:
-                attrs = {"node_type": node_type} if node_type else {}
-                attrs.update(props)
-                G.add_node(node_id, **attrs)
+        srcs = str_column(df, s_idx)
+        tgts = str_column(df, t_idx)
+        rel_types = intern_column(df, rel_idx) if rel_idx is not None else repeat("RELATED_TO")
 
-    add_nodes_from_df(nodes_doc_df, "nodes_doc")
-    add_nodes_from_df(nodes_draw_df, "nodes_draw")
+        # ensure nodes exist: endpoints not in G yet become placeholders, added in one batch
+        # (in first-seen order, so node order does not depend on set hashing)
+        endpoints = dict.fromkeys(chain.from_iterable(zip(srcs, tgts)))
+        G.add_nodes_from([(n, {"node_type": "unknown", "placeholder": True}) for n in endpoints if n not in G])
 
-    # Edges
-    if relations_df is not None:
-        # find source & target column names
-        s_col = None
-        for c in ["source_id", "source", "from", "From"]:
-            if c in relations_df.columns:
-                s_col = c
-                break
-        t_col = None
-        for c in ["target_id", "target", "to", "To"]:
-            if c in relations_df.columns:
-                t_col = c
-                break
-        if s_col is None or t_col is None:
-            raise KeyError("Relations CSV must contain source and target columns (e.g. source_id, target_id)")
+        if edge_titles_out is not None:
+            titles = edge_titles(df, rel_idx, drop_idx={s_idx, t_idx, rel_idx})
+            for pair, title in zip(zip(srcs, tgts), titles):
+                edge_titles_out[pair] = None if pair in edge_titles_out else title
 
-        # relationship type column
-        rel_col = None
-        for c in ["relationship_type", "rel_type", "type", "relationship"]:
-            if c in relations_df.columns:
-                rel_col = c
-                break
-
-        for _, row in relations_df.iterrows():
-            src = str(row[s_col])
-            tgt = str(row[t_col])
-            rel_type = row[rel_col] if rel_col and rel_col in row.index else "RELATED_TO"
-            edge_props = parse_properties_from_row(row, drop_cols=[s_col, t_col, rel_col])
-            # ensure nodes exist (create placeholder if necessary)
-            if src not in G:
-                G.add_node(src, node_type="unknown", placeholder=True)
-            if tgt not in G:
-                G.add_node(tgt, node_type="unknown", placeholder=True)
+        edges_batch = []
+        for src, tgt, rel_type, edge_props in zip(srcs, tgts, rel_types, props_by_row):
             attrs = {"relationship": rel_type}
             attrs.update(edge_props)
-            G.add_edge(src, tgt, **attrs)
+            edges_batch.append((src, tgt, attrs))
+        # insert grouped by source id (stable sort, so repeated pairs still merge in row order);
+        # a store that appends edges then keeps each node's out-edges adjacent
+        edges_batch.sort(key=itemgetter(0))
+        G.add_edges_from(edges_batch)
+
+    for chunk in iter_frames(nodes_doc_df):
+        add_nodes_from_df(chunk, "nodes_doc")
+    for chunk in iter_frames(nodes_draw_df):
+        add_nodes_from_df(chunk, "nodes_draw")
+
+    # Edges
+    for chunk in iter_frames(relations_df):
+        add_edges_from_df(chunk)
 
     return G
 
 
-def export_pyvis(G: nx.DiGraph, output_html: str = "technical_kg_poc.html", open_in_browser: bool = True):
+def export_pyvis(G: Graph, output_html: str = "technical_kg_poc.html", open_in_browser: bool = True,
+                 renderer: Optional[str] = None, edge_titles: Optional[dict] = None):
+    """Write G as a standalone HTML page using one of RENDERERS. With renderer=None, the
+    vis-network page (pyvis) is used up to WEBGL_NODE_THRESHOLD nodes and sigma above it.
+    edge_titles holds precomputed edge tooltips (see build_graph's edge_titles_out)."""
     import os
     import webbrowser
 
     if G.number_of_nodes() == 0:
         logging.warning("Graph is empty: 0 nodes. Nothing to export.")
         return
-
-    net = Network(
-        notebook=False,
-        directed=True,
-        height="750px",
-        width="100%",
-        bgcolor="#222222",
-        font_color="white"
-    )
-
-    try:
-        net.repulsion(node_distance=200, spring_length=200)
-    except Exception:
-        pass
-
-    # Add nodes
+    if renderer is None:
+        renderer = "pyvis" if G.number_of_nodes() <= WEBGL_NODE_THRESHOLD else "sigma"
+        logging.info("Using the %s renderer for %d nodes", renderer, G.number_of_nodes())
+
+    # Build the node/edge records directly (attribute keys are prettified once, not once per
+    # node); shape, font and colours are shared and set once in the page templates.
+    pretty_key = {k: k.replace('_', ' ').title() for _, data in G.nodes(data=True) for k in data}
+    nodes = []
     for node_id, data in G.nodes(data=True):
         label = data.get("part_number") or data.get("name") or node_id
         title_lines = [f"Type: {data.get('node_type','N/A')}"]
-        for k, v in data.items():
-            if k == "node_type":
-                continue
-            if isinstance(v, (dict, list)):
-                v_text = json.dumps(v)
-            else:
-                v_text = str(v)
-            title_lines.append(f"{k.replace('_',' ').title()}: {v_text}")
-        title = "<br>".join(title_lines)
-        net.add_node(node_id, label=label, title=title, group=data.get('node_type', 'default'))
-
-    # Add edges
-    for u, v, edata in G.edges(data=True):
-        label = edata.get('relationship', edata.get('relationship_type', ''))
-        title = "; ".join(f"{k}: {v}" for k, v in edata.items())
-        net.add_edge(u, v, title=title, label=label)
+        title_lines.extend(
+            f"{pretty_key[k]}: {title_text(v)}"
+            for k, v in data.items() if k != "node_type"
+        )
+        nodes.append({
+            "id": node_id,
+            "label": label,
+            "title": "<br>".join(title_lines),
+            "group": data.get('node_type', 'default'),
+        })
+
+    edge_titles = edge_titles or {}
+    edges = [
+        {
+            "from": src,
+            "to": dst,
+            # use build_graph's precomputed tooltip; merged or externally added edges get it built here
+            "title": edge_titles.get((src, dst)) or "; ".join(f"{k}: {title_text(v)}" for k, v in edata.items()),
+            "label": edata.get('relationship', edata.get('relationship_type', '')),
+        }
+        for src, dst, edata in G.edges(data=True)
+    ]
+
+    # Serialize once and inline into the page; <, > and & are escaped so that values
+    # containing e.g. "</script>" cannot end the script block
+    graph = {"nodes": nodes, "edges": edges}
+    graph_json = json_dumps(graph).replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
 
     # Save to HTML and open in browser
     logging.info("Writing HTML visualization to %s", output_html)
-    net.write_html(output_html)  # safer than net.show() in VS Code
+    Path(output_html).write_text(RENDERERS[renderer].replace("/*GRAPH_JSON*/", graph_json), encoding="utf-8")
     if open_in_browser:
         webbrowser.open('file://' + os.path.abspath(output_html))
 
 
-
 def main():
     parser = argparse.ArgumentParser(description="Build a knowledge graph from CSVs and export an interactive HTML (pyvis)")
     parser.add_argument("--nodes-doc", default="NodeDocuments.csv", help="CSV with document nodes (default: NodeDocuments.csv)")
@@ -241,32 +729,45 @@ def main():
     parser.add_argument("--output", default="technical_kg_poc.html", help="Output HTML file")
     parser.add_argument("--no-open", action="store_true", help="Do not open the generated HTML in a browser")
     parser.add_argument("--create-sample-if-missing", action="store_true", help="Create sample CSVs if any input file is missing and use them")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="networkx", help="Graph library used to hold the graph (default: networkx)")
+    parser.add_argument("--renderer", choices=list(RENDERERS), default=None,
+                        help=f"HTML renderer (default: pyvis up to {WEBGL_NODE_THRESHOLD} nodes, sigma (WebGL) above)")
+    parser.add_argument("--node-props", nargs="*", metavar="COLUMN", default=None,
+                        help="Only read these property columns from the node CSVs, besides id/type (default: all columns)")
+    parser.add_argument("--relation-props", nargs="*", metavar="COLUMN", default=None,
+                        help="Only read these property columns from the relations CSV, besides source/target/type (default: all columns)")
+    parser.add_argument("--chunksize", type=int, default=None, help="Stream CSVs in chunks of this many rows to bound peak memory (default: read whole files)")
     args = parser.parse_args()
+    if args.backend == "rustworkx" and rx is None:
+        parser.error("--backend rustworkx requires rustworkx (pip install rustworkx)")
+    node_cols = NODE_KEY_COLUMNS + args.node_props if args.node_props is not None else None
+    rel_cols = RELATION_KEY_COLUMNS + args.relation_props if args.relation_props is not None else None
 
-    nodes_doc_df = read_csv_if_exists(args.nodes_doc)
-    nodes_draw_df = read_csv_if_exists(args.nodes_draw)
-    relations_df = read_csv_if_exists(args.relations)
+    nodes_doc_df = read_csv_if_exists(args.nodes_doc, args.chunksize, node_cols)
+    nodes_draw_df = read_csv_if_exists(args.nodes_draw, args.chunksize, node_cols)
+    relations_df = read_csv_if_exists(args.relations, args.chunksize, rel_cols)
 
     if args.create_sample_if_missing and (nodes_doc_df is None or nodes_draw_df is None or relations_df is None):
         s_doc, s_draw, s_rel = create_sample_files()
-        nodes_doc_df = read_csv_if_exists(s_doc)
-        nodes_draw_df = read_csv_if_exists(s_draw)
-        relations_df = read_csv_if_exists(s_rel)
+        nodes_doc_df = read_csv_if_exists(s_doc, args.chunksize, node_cols)
+        nodes_draw_df = read_csv_if_exists(s_draw, args.chunksize, node_cols)
+        relations_df = read_csv_if_exists(s_rel, args.chunksize, rel_cols)
     else:
         # if any are missing, create sample automatically (friendly behaviour)
         if nodes_doc_df is None or nodes_draw_df is None or relations_df is None:
             logging.warning("One or more input CSVs not found. Creating sample CSVs in ./sample_data/ and using them.")
             s_doc, s_draw, s_rel = create_sample_files()
-            nodes_doc_df = read_csv_if_exists(s_doc)
-            nodes_draw_df = read_csv_if_exists(s_draw)
-            relations_df = read_csv_if_exists(s_rel)
+            nodes_doc_df = read_csv_if_exists(s_doc, args.chunksize, node_cols)
+            nodes_draw_df = read_csv_if_exists(s_draw, args.chunksize, node_cols)
+            relations_df = read_csv_if_exists(s_rel, args.chunksize, rel_cols)
 
     # Build graph
-    G = build_graph(nodes_doc_df, nodes_draw_df, relations_df)
+    edge_titles = {}
+    G = build_graph(nodes_doc_df, nodes_draw_df, relations_df, backend=args.backend, edge_titles_out=edge_titles)
     logging.info("Graph built: %d nodes, %d edges", G.number_of_nodes(), G.number_of_edges())
 
     # Export to HTML (pyvis)
-    export_pyvis(G, args.output, open_in_browser=(not args.no_open))
+    export_pyvis(G, args.output, open_in_browser=(not args.no_open), renderer=args.renderer, edge_titles=edge_titles)
 
 
 if __name__ == "__main__":